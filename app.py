@@ -5,7 +5,12 @@ A GUI application to save and restore Windows Explorer sessions with window geom
 """
 import os
 import sys
+import types
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import tkinter
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
 from session_manager import SessionManager
@@ -16,84 +21,150 @@ ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
 
+def _weak_callback(callback):
+    """Return a zero-argument resolver for a widget callback.
+    
+    Bound methods are held through a WeakMethod so widgets don't keep their
+    owner alive; other callables (and None) are held strongly.
+    """
+    if isinstance(callback, types.MethodType):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
+
+def _set_text(widget, text):
+    """Set a widget's text, skipping the Tcl call when it is unchanged."""
+    if widget.cget("text") != text:
+        widget.configure(text=text)
+
+
+# Shared fonts, created once by _init_fonts() after the Tk root exists
+FONTS = {}
+
+
+def _init_fonts():
+    """Create the shared CTkFont objects used by all widgets."""
+    if FONTS:
+        return
+    for size in (10, 11, 12, 13, 14, 16, 18, 24):
+        FONTS[f"normal{size}"] = ctk.CTkFont(size=size)
+    for size in (12, 13, 18, 20):
+        FONTS[f"bold{size}"] = ctk.CTkFont(size=size, weight="bold")
+
+
+@lru_cache(maxsize=512)
+def _format_timestamp(saved_at: str) -> str:
+    """Format an ISO timestamp for display, falling back to the raw string."""
+    if not saved_at:
+        return ""
+    try:
+        dt = datetime.fromisoformat(saved_at)
+        return dt.strftime("%b %d, %Y at %I:%M:%S %p")
+    except:
+        return saved_at
+
+
+# Plural suffix indexed by "count == 1"
+_PLURAL = {True: "", False: "s"}
+
+
+@lru_cache(maxsize=256)
+def _format_counts(window_count: int, tab_count: int) -> str:
+    """Format window/tab counts as e.g. '2 Windows - 1 Tab'."""
+    return f"{window_count} Window{_PLURAL[window_count == 1]} - {tab_count} Tab{_PLURAL[tab_count == 1]}"
+
+
+@lru_cache(maxsize=1024)
+def _folder_name(path: str) -> str:
+    """Return the display name of a folder path, handling trailing separators."""
+    folder_name = os.path.basename(path)
+    if not folder_name:  # If path ends with backslash
+        folder_name = os.path.basename(os.path.dirname(path))
+    return folder_name
+
+
 class SessionCard(ctk.CTkFrame):
     """A card widget displaying a saved session."""
     
+    # Shared configure kwargs for the card frame and its selection states
+    _FRAME_KW = {"fg_color": "white", "corner_radius": 8, "border_width": 1, "border_color": "#E0E0E0"}
+    _SELECTED_KW = {"border_color": "#FF8C00", "border_width": 2}
+    _UNSELECTED_KW = {"border_color": "#E0E0E0", "border_width": 1}
+    _STATE_KW = {True: _SELECTED_KW, False: _UNSELECTED_KW}
+    
     def __init__(self, parent, session_data, on_select, on_restore, on_delete, **kwargs):
         super().__init__(parent, **kwargs)
         
+        # Bind hot lookups to locals once; there are many of them per card
+        get = session_data.get
+        Frame, Label, Button = ctk.CTkFrame, ctk.CTkLabel, ctk.CTkButton
+        
         self.session_data = session_data
-        self.on_select = on_select
-        self.on_restore = on_restore
-        self.on_delete = on_delete
+        self.filepath = get("filepath")
+        self._selected_state = False
+        self.on_select = _weak_callback(on_select)
+        self.on_restore = _weak_callback(on_restore)
+        self.on_delete = _weak_callback(on_delete)
         
         # Configure card appearance
-        self.configure(fg_color="white", corner_radius=8, border_width=1, border_color="#E0E0E0")
+        self.configure(**self._FRAME_KW)
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=0)
         
         # Left side content frame
-        content_frame = ctk.CTkFrame(self, fg_color="transparent")
+        content_frame = Frame(self, fg_color="transparent")
         content_frame.grid(row=0, column=0, sticky="nsew", padx=15, pady=15)
         
         # Session name/title
-        name = session_data.get("name", "Restore Explorer Windows")
-        self.title_label = ctk.CTkLabel(
+        name = get("name", "Restore Explorer Windows")
+        self.title_label = Label(
             content_frame,
             text=name,
-            font=ctk.CTkFont(size=14, weight="normal"),
+            font=FONTS["normal14"],
             text_color="#2B2B2B",
             anchor="w"
         )
         self.title_label.pack(anchor="w")
         
         # Session info
-        window_count = session_data.get("window_count", 0)
-        tab_count = session_data.get("tab_count", 0)
-        info_text = f"{window_count} Window{'s' if window_count != 1 else ''} - {tab_count} Tab{'s' if tab_count != 1 else ''}"
-        self.info_label = ctk.CTkLabel(
+        window_count = get("window_count", 0)
+        tab_count = get("tab_count", 0)
+        info_text = _format_counts(window_count, tab_count)
+        self.info_label = Label(
             content_frame,
             text=info_text,
-            font=ctk.CTkFont(size=12),
+            font=FONTS["normal12"],
             text_color="#757575",
             anchor="w"
         )
         self.info_label.pack(anchor="w", pady=(5, 0))
         
         # Timestamp
-        saved_at = session_data.get("saved_at", "")
-        if saved_at:
-            try:
-                dt = datetime.fromisoformat(saved_at)
-                timestamp_text = dt.strftime("%b %d, %Y at %I:%M:%S %p")
-            except:
-                timestamp_text = saved_at
-        else:
-            timestamp_text = ""
+        timestamp_text = _format_timestamp(get("saved_at", ""))
         
-        self.timestamp_label = ctk.CTkLabel(
+        self.timestamp_label = Label(
             content_frame,
             text=timestamp_text,
-            font=ctk.CTkFont(size=11),
+            font=FONTS["normal11"],
             text_color="#9E9E9E",
             anchor="w"
         )
         self.timestamp_label.pack(anchor="w", pady=(5, 0))
         
         # Right side button frame with icons
-        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame = Frame(self, fg_color="transparent")
         button_frame.grid(row=0, column=1, sticky="e", padx=15, pady=15)
         
         # Restore button with icon (vertical layout) - clickable container
-        self.restore_container = ctk.CTkFrame(button_frame, fg_color="transparent", cursor="hand2")
+        self.restore_container = Frame(button_frame, fg_color="transparent", cursor="hand2")
         self.restore_container.grid(row=0, column=0, padx=(0, 15))
         
-        self.restore_btn = ctk.CTkButton(
+        self.restore_btn = Button(
             self.restore_container,
             text="🔄",
             width=50,
             height=50,
-            font=ctk.CTkFont(size=24),
+            font=FONTS["normal24"],
             fg_color="transparent",
             hover_color="#FFF3E0",
             text_color="#2B2B2B",
@@ -102,25 +173,25 @@ class SessionCard(ctk.CTkFrame):
         )
         self.restore_btn.pack()
         
-        self.restore_label = ctk.CTkLabel(
+        self.restore_label = Label(
             self.restore_container,
             text="Restore",
-            font=ctk.CTkFont(size=10),
+            font=FONTS["normal10"],
             text_color="#757575",
             cursor="hand2"
         )
         self.restore_label.pack()
         
         # Delete button with icon (vertical layout) - clickable container with red hover
-        self.delete_container = ctk.CTkFrame(button_frame, fg_color="transparent", cursor="hand2")
+        self.delete_container = Frame(button_frame, fg_color="transparent", cursor="hand2")
         self.delete_container.grid(row=0, column=1)
         
-        self.delete_btn = ctk.CTkButton(
+        self.delete_btn = Button(
             self.delete_container,
             text="🗑",
             width=50,
             height=50,
-            font=ctk.CTkFont(size=24),
+            font=FONTS["normal24"],
             fg_color="transparent",
             hover_color="#FFEBEE",
             text_color="#757575",
@@ -129,10 +200,10 @@ class SessionCard(ctk.CTkFrame):
         )
         self.delete_btn.pack()
         
-        self.delete_label = ctk.CTkLabel(
+        self.delete_label = Label(
             self.delete_container,
             text="Delete",
-            font=ctk.CTkFont(size=10),
+            font=FONTS["normal10"],
             text_color="#757575",
             cursor="hand2"
         )
@@ -167,20 +238,38 @@ class SessionCard(ctk.CTkFrame):
         self.info_label.bind("<Button-1>", self._on_card_clicked)
         self.timestamp_label.bind("<Button-1>", self._on_card_clicked)
     
+    def update_session(self, session_data):
+        """Refresh the displayed text from new session data in place."""
+        self.session_data = session_data
+        
+        name = session_data.get("name", "Restore Explorer Windows")
+        _set_text(self.title_label, name)
+        
+        window_count = session_data.get("window_count", 0)
+        tab_count = session_data.get("tab_count", 0)
+        info_text = _format_counts(window_count, tab_count)
+        _set_text(self.info_label, info_text)
+        
+        timestamp_text = _format_timestamp(session_data.get("saved_at", ""))
+        _set_text(self.timestamp_label, timestamp_text)
+    
     def _on_card_clicked(self, event=None):
         """Handle card click."""
-        if self.on_select:
-            self.on_select(self.session_data)
+        callback = self.on_select()
+        if callback:
+            callback(self.session_data)
     
     def _on_restore_clicked(self):
         """Handle restore button click."""
-        if self.on_restore:
-            self.on_restore(self.session_data)
+        callback = self.on_restore()
+        if callback:
+            callback(self.session_data)
     
     def _on_delete_clicked(self):
         """Handle delete button click."""
-        if self.on_delete:
-            self.on_delete(self.session_data)
+        callback = self.on_delete()
+        if callback:
+            callback(self.session_data)
     
     def _on_restore_hover_enter(self, event=None):
         """Change restore button to golden/orange on hover."""
@@ -200,38 +289,44 @@ class SessionCard(ctk.CTkFrame):
     
     def set_selected(self, selected: bool):
         """Update appearance to show selection state."""
-        if selected:
-            self.configure(border_color="#FF8C00", border_width=2)
-        else:
-            self.configure(border_color="#E0E0E0", border_width=1)
+        selected = bool(selected)
+        if selected == self._selected_state:
+            return
+        self._selected_state = selected
+        self.configure(**self._STATE_KW[selected])
 
 
 class PathItem(ctk.CTkFrame):
     """A widget displaying a single folder path."""
     
+    # Shared configure kwargs for the row frame
+    _FRAME_KW = {"fg_color": "#F5F5F5", "corner_radius": 6, "height": 50}
+    
+    # Delete button colors while the pointer is over / away from the row
+    _HOVER_ON = {"fg_color": "#FFEBEE", "text_color": "#C62828"}
+    _HOVER_OFF = {"fg_color": "transparent", "text_color": "#BDBDBD"}
+    
     def __init__(self, parent, path, on_delete=None, **kwargs):
         super().__init__(parent, **kwargs)
         
         self.path = path
-        self.on_delete = on_delete
+        self.on_delete = _weak_callback(on_delete)
         
         # Configure appearance
-        self.configure(fg_color="#F5F5F5", corner_radius=6, height=50)
+        self.configure(**self._FRAME_KW)
         self.grid_columnconfigure(1, weight=1)
         
         # Folder icon (using emoji)
         self.icon_label = ctk.CTkLabel(
             self,
             text="📁",
-            font=ctk.CTkFont(size=16),
+            font=FONTS["normal16"],
             width=30
         )
         self.icon_label.grid(row=0, column=0, padx=(15, 10), pady=10, sticky="w")
         
         # Extract folder name and full path
-        folder_name = os.path.basename(path) if path else "Unknown"
-        if not folder_name:  # If path ends with backslash
-            folder_name = os.path.basename(os.path.dirname(path))
+        folder_name = _folder_name(path) if path else "Unknown"
         
         # Text container frame
         text_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -243,7 +338,7 @@ class PathItem(ctk.CTkFrame):
         self.name_label = ctk.CTkLabel(
             text_frame,
             text=folder_name + ":",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=FONTS["bold12"],
             text_color="#2B2B2B",
             anchor="w"
         )
@@ -253,7 +348,7 @@ class PathItem(ctk.CTkFrame):
         self.path_label = ctk.CTkLabel(
             text_frame,
             text=path,
-            font=ctk.CTkFont(size=12),
+            font=FONTS["normal12"],
             text_color="#757575",
             anchor="w"
         )
@@ -268,7 +363,7 @@ class PathItem(ctk.CTkFrame):
                 text="🗑",
                 width=32,
                 height=32,
-                font=ctk.CTkFont(size=14),
+                font=FONTS["normal14"],
                 fg_color="transparent",
                 hover_color="#FFCDD2",
                 text_color="#BDBDBD",  # Light gray when not hovering on row
@@ -277,38 +372,28 @@ class PathItem(ctk.CTkFrame):
             )
             self.delete_btn.grid(row=0, column=2, padx=(0, 15), pady=10, sticky="e")
             
-            # Bind hover events to change delete button appearance
-            self.bind("<Enter>", self._on_hover_enter)
-            self.bind("<Leave>", self._on_hover_leave)
-            self.icon_label.bind("<Enter>", self._on_hover_enter)
-            self.icon_label.bind("<Leave>", self._on_hover_leave)
-            text_frame.bind("<Enter>", self._on_hover_enter)
-            text_frame.bind("<Leave>", self._on_hover_leave)
-            self.name_label.bind("<Enter>", self._on_hover_enter)
-            self.name_label.bind("<Leave>", self._on_hover_leave)
-            self.path_label.bind("<Enter>", self._on_hover_enter)
-            self.path_label.bind("<Leave>", self._on_hover_leave)
+            # Bind hover on the row's own Tk frame: CTkFrame.bind goes to its
+            # canvas, a sibling of the children, while the frame gets one
+            # Enter/Leave as the pointer crosses the row's outer edge and
+            # nothing for moves between children
+            tkinter.Frame.bind(self, "<Enter>", self._on_hover_enter, "+")
+            tkinter.Frame.bind(self, "<Leave>", self._on_hover_leave, "+")
     
     def _on_hover_enter(self, event=None):
         """Highlight delete button on hover."""
         if self.delete_btn:
-            self.delete_btn.configure(
-                fg_color="#FFEBEE",
-                text_color="#C62828"
-            )
+            self.delete_btn.configure(**self._HOVER_ON)
     
     def _on_hover_leave(self, event=None):
         """Dim delete button when not hovering."""
         if self.delete_btn:
-            self.delete_btn.configure(
-                fg_color="transparent",
-                text_color="#BDBDBD"
-            )
+            self.delete_btn.configure(**self._HOVER_OFF)
     
     def _on_delete_clicked(self):
         """Handle delete button click."""
-        if self.on_delete:
-            self.on_delete(self.path)
+        callback = self.on_delete()
+        if callback:
+            callback(self.path)
 
 
 class SnapBackApp(ctk.CTk):
@@ -317,10 +402,19 @@ class SnapBackApp(ctk.CTk):
     def __init__(self):
         super().__init__()
         
+        # Shared fonts need the Tk root, so create them before any widgets
+        _init_fonts()
+        
         # Initialize session manager
         self.session_manager = SessionManager()
         self.selected_session = None
-        self.session_cards = []
+        self.cards_by_filepath = {}
+        self._selected_card = None
+        self.no_sessions_label = None
+        
+        # Worker pool for session file reads, so disk I/O stays off the UI thread
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_paths_future = None
         
         # Configure window
         self.title("SnapBack - Explorer Session Manager")
@@ -361,7 +455,7 @@ class SnapBackApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📁 SnapBack",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=FONTS["bold20"],
             text_color="#FF8C00",
             anchor="w"
         )
@@ -371,7 +465,7 @@ class SnapBackApp(ctk.CTk):
         search_label = ctk.CTkLabel(
             header_frame,
             text="🔍",
-            font=ctk.CTkFont(size=18),
+            font=FONTS["normal18"],
             text_color="#757575"
         )
         search_label.grid(row=0, column=1, sticky="e")
@@ -386,7 +480,7 @@ class SnapBackApp(ctk.CTk):
             action_frame,
             placeholder_text="Enter session name...",
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=FONTS["normal14"],
             fg_color="white",
             border_width=1,
             border_color="#E0E0E0",
@@ -400,7 +494,7 @@ class SnapBackApp(ctk.CTk):
             text="+",
             width=45,
             height=45,
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=FONTS["bold20"],
             fg_color="#FF8C00",
             hover_color="#FF7700",
             text_color="white",
@@ -437,7 +531,7 @@ class SnapBackApp(ctk.CTk):
         self.detail_title = ctk.CTkLabel(
             self.detail_header,
             text="Select a session to view details",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=FONTS["bold18"],
             text_color="#2B2B2B",
             anchor="w"
         )
@@ -447,7 +541,7 @@ class SnapBackApp(ctk.CTk):
         self.detail_info = ctk.CTkLabel(
             self.detail_header,
             text="",
-            font=ctk.CTkFont(size=13),
+            font=FONTS["normal13"],
             text_color="#757575",
             anchor="w"
         )
@@ -457,12 +551,22 @@ class SnapBackApp(ctk.CTk):
         self.detail_timestamp = ctk.CTkLabel(
             self.detail_header,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=FONTS["normal12"],
             text_color="#9E9E9E",
             anchor="w"
         )
         self.detail_timestamp.grid(row=2, column=0, sticky="w", padx=30, pady=(0, 20))
         
+        # Paths area (paths_frame and add_folder_btn) is built lazily by
+        # _build_paths_area() on the first session selection
+        self.add_folder_btn = None
+        self.paths_error_label = None
+        
+        # PathItem rows currently shown in paths_frame
+        self.path_items = []
+    
+    def _build_paths_area(self):
+        """Create the scrollable paths frame and the Add Folder button."""
         # Scrollable frame for paths
         self.paths_frame = ctk.CTkScrollableFrame(
             self.right_panel,
@@ -472,93 +576,137 @@ class SnapBackApp(ctk.CTk):
         self.paths_frame.grid(row=1, column=0, sticky="nsew", padx=30, pady=(10, 30))
         self.paths_frame.grid_columnconfigure(0, weight=1)
         
-        # Add Folder button (will be placed inside paths_frame when session is selected)
-        self.add_folder_btn = None
+        # Slim Add Folder button at the top - same height as folder items
+        self.add_folder_btn = ctk.CTkButton(
+            self.paths_frame,
+            text="📁  ADD NEW FOLDER WINDOW +++",
+            height=50,  # Same as PathItem height
+            font=FONTS["bold13"],
+            fg_color="#FF8C00",
+            hover_color="#FF7700",
+            text_color="white",
+            corner_radius=6,
+            anchor="center",
+            command=self.add_folder_to_session
+        )
+        # Grid once so the options are remembered, then toggle with grid()/grid_remove()
+        self.add_folder_btn.grid(row=0, column=0, sticky="ew", pady=(0, 8))
+        self.add_folder_btn.grid_remove()
     
     def load_sessions(self):
-        """Load all sessions and display them."""
-        # Clear existing cards
-        for card in self.session_cards:
-            card.destroy()
-        self.session_cards.clear()
+        """Load all sessions and display them.
         
+        Existing cards are reused (keyed by filepath) so only added or
+        removed sessions cause widgets to be created or destroyed.
+        """
         # Load sessions from manager
         sessions = self.session_manager.list_sessions()
-        
-        # Create cards
+        new_keys = [s["filepath"] for s in sessions]
+        new_key_set = set(new_keys)
+        
+        # Destroy cards for sessions that no longer exist
+        for filepath in list(self.cards_by_filepath):
+            if filepath not in new_key_set:
+                card = self.cards_by_filepath.pop(filepath)
+                if card is self._selected_card:
+                    self._selected_card = None
+                card.destroy()
+        
+        if self.no_sessions_label is not None and sessions:
+            self.no_sessions_label.destroy()
+            self.no_sessions_label = None
+        
+        # Update surviving cards and create new ones, in display order
+        selected_filepath = self.selected_session.get("filepath") if self.selected_session else None
         for i, session in enumerate(sessions):
-            card = SessionCard(
-                self.sessions_frame,
-                session,
-                on_select=self.select_session,
-                on_restore=self.restore_session,
-                on_delete=self.delete_session
-            )
-            card.grid(row=i, column=0, sticky="ew", pady=(0, 10))
-            self.session_cards.append(card)
+            card = self.cards_by_filepath.get(session["filepath"])
+            if card is not None:
+                card.update_session(session)
+                card.grid_configure(row=i)
+            else:
+                card = SessionCard(
+                    self.sessions_frame,
+                    session,
+                    on_select=self.select_session,
+                    on_restore=self.restore_session,
+                    on_delete=self.delete_session
+                )
+                card.grid(row=i, column=0, sticky="ew", pady=(0, 10))
+                if session["filepath"] == selected_filepath:
+                    card.set_selected(True)
+                    self._selected_card = card
+                self.cards_by_filepath[session["filepath"]] = card
         
         # If no sessions, show a message
-        if not sessions:
-            no_sessions_label = ctk.CTkLabel(
+        if not sessions and self.no_sessions_label is None:
+            self.no_sessions_label = ctk.CTkLabel(
                 self.sessions_frame,
                 text="No saved sessions yet.\nClick '+' to save current Explorer windows.",
-                font=ctk.CTkFont(size=13),
+                font=FONTS["normal13"],
                 text_color="#9E9E9E",
                 justify="center"
             )
-            no_sessions_label.grid(row=0, column=0, pady=50)
+            self.no_sessions_label.grid(row=0, column=0, pady=50)
     
-    def select_session(self, session_data):
-        """Display session details in right panel."""
+    def select_session(self, session_data, force=False):
+        """Display session details in right panel.
+        
+        Re-selecting the already displayed session is a no-op unless
+        force is True (used after the session file has been modified) or
+        its details failed to load, so clicking it again retries.
+        """
+        get = session_data.get
+        filepath = get("filepath")
+        if (not force and self.paths_error_label is None
+                and self.selected_session is not None
+                and self.selected_session.get("filepath") == filepath):
+            return
+        
         self.selected_session = session_data
         
-        # Update card selection states
-        for card in self.session_cards:
-            card.set_selected(card.session_data == session_data)
+        # Update card selection states - only the old and new card change
+        new_card = self.cards_by_filepath.get(filepath)
+        if new_card is not self._selected_card:
+            if self._selected_card is not None:
+                self._selected_card.set_selected(False)
+            if new_card is not None:
+                new_card.set_selected(True)
+            self._selected_card = new_card
         
         # Update header
-        name = session_data.get("name", "Restore Explorer Windows")
-        self.detail_title.configure(text=name)
+        name = get("name", "Restore Explorer Windows")
+        _set_text(self.detail_title, name)
         
-        window_count = session_data.get("window_count", 0)
-        tab_count = session_data.get("tab_count", 0)
-        info_text = f"{window_count} Window{'s' if window_count != 1 else ''} - {tab_count} Tab{'s' if tab_count != 1 else ''}"
-        self.detail_info.configure(text=info_text)
-        
-        saved_at = session_data.get("saved_at", "")
-        if saved_at:
-            try:
-                dt = datetime.fromisoformat(saved_at)
-                timestamp_text = dt.strftime("%b %d, %Y at %I:%M:%S %p")
-            except:
-                timestamp_text = saved_at
+        window_count = get("window_count", 0)
+        tab_count = get("tab_count", 0)
+        info_text = _format_counts(window_count, tab_count)
+        _set_text(self.detail_info, info_text)
+        
+        timestamp_text = _format_timestamp(get("saved_at", ""))
+        _set_text(self.detail_timestamp, timestamp_text)
+        
+        # Build the paths area on first use, otherwise clear existing path items
+        if not hasattr(self, "paths_frame"):
+            self._build_paths_area()
         else:
-            timestamp_text = ""
-        self.detail_timestamp.configure(text=timestamp_text)
+            self._clear_paths_frame()
         
-        # Clear existing path items
-        for widget in self.paths_frame.winfo_children():
-            widget.destroy()
+        self.add_folder_btn.grid()
         
-        # Create slim Add Folder button at the top - same height as folder items
-        self.add_folder_btn = ctk.CTkButton(
-            self.paths_frame,
-            text="📁  ADD NEW FOLDER WINDOW +++",
-            height=50,  # Same as PathItem height
-            font=ctk.CTkFont(size=13, weight="bold"),
-            fg_color="#FF8C00",
-            hover_color="#FF7700",
-            text_color="white",
-            corner_radius=6,
-            anchor="center",
-            command=self.add_folder_to_session
-        )
-        self.add_folder_btn.grid(row=0, column=0, sticky="ew", pady=(0, 8))
+        # Load session data in the background and display paths when ready
+        future = self._io_pool.submit(self.session_manager.load_session, filepath)
+        self._pending_paths_future = future
+        future.add_done_callback(lambda f: self.after(0, self._render_paths, f, filepath))
+    
+    def _render_paths(self, future, filepath):
+        """Build the path list from a finished session load."""
+        # Ignore results from selections that have since been superseded
+        if future is not self._pending_paths_future:
+            return
+        self._pending_paths_future = None
         
-        # Load session data and display paths
         try:
-            filepath = session_data.get("filepath")
-            session_full_data = self.session_manager.load_session(filepath)
+            session_full_data = future.result()
             windows = session_full_data.get("windows", [])
             
             for i, window in enumerate(windows):
@@ -570,14 +718,28 @@ class SnapBackApp(ctk.CTk):
                         on_delete=lambda p=path: self.delete_path_from_session(p, filepath)
                     )
                     path_item.grid(row=i+1, column=0, sticky="ew", pady=(0, 8))
+                    self.path_items.append(path_item)
         except Exception as e:
-            error_label = ctk.CTkLabel(
+            self.paths_error_label = ctk.CTkLabel(
                 self.paths_frame,
                 text=f"Error loading session details:\n{str(e)}",
-                font=ctk.CTkFont(size=12),
+                font=FONTS["normal12"],
                 text_color="#C62828"
             )
-            error_label.grid(row=1, column=0, pady=20)
+            self.paths_error_label.grid(row=1, column=0, pady=20)
+    
+    def _clear_paths_frame(self):
+        """Destroy the widgets shown in the paths frame."""
+        for path_item in self.path_items:
+            path_item.destroy()
+        self.path_items.clear()
+        
+        if self.add_folder_btn is not None:
+            self.add_folder_btn.grid_remove()
+        
+        if self.paths_error_label is not None:
+            self.paths_error_label.destroy()
+            self.paths_error_label = None
     
     def save_current_session(self):
         """Save current Explorer session."""
@@ -598,6 +760,11 @@ class SnapBackApp(ctk.CTk):
             # Reload sessions
             self.load_sessions()
             
+            # Saving under an existing name overwrites that session, so
+            # refresh the details if it is the one being displayed
+            if self.selected_session and self.selected_session.get("filepath") == filepath:
+                self.select_session(self.cards_by_filepath[filepath].session_data, force=True)
+            
             # Show success message
             messagebox.showinfo(
                 "Success",
@@ -646,11 +813,11 @@ class SnapBackApp(ctk.CTk):
             # Clear right panel if this was the selected session
             if self.selected_session == session_data:
                 self.selected_session = None
+                self._pending_paths_future = None
                 self.detail_title.configure(text="Select a session to view details")
                 self.detail_info.configure(text="")
                 self.detail_timestamp.configure(text="")
-                for widget in self.paths_frame.winfo_children():
-                    widget.destroy()
+                self._clear_paths_frame()
             
             # Reload sessions
             self.load_sessions()
@@ -664,9 +831,7 @@ class SnapBackApp(ctk.CTk):
         """Delete a specific path from a session (UI wrapper)."""
         try:
             # Confirm deletion
-            folder_name = os.path.basename(path_to_delete) if path_to_delete else "this folder"
-            if not folder_name:
-                folder_name = os.path.basename(os.path.dirname(path_to_delete))
+            folder_name = _folder_name(path_to_delete) if path_to_delete else "this folder"
             
             if not messagebox.askyesno(
                 "Remove Folder",
@@ -679,6 +844,8 @@ class SnapBackApp(ctk.CTk):
                 session_filepath, 
                 path_to_delete
             )
+            # Write the queued edit now so a failure is reported below
+            self.session_manager.flush()
             
             # If session is now empty (returns False)
             if not session_has_paths:
@@ -689,28 +856,35 @@ class SnapBackApp(ctk.CTk):
                 
                 # Clear right panel
                 self.selected_session = None
+                self._pending_paths_future = None
                 self.detail_title.configure(text="Select a session to view details")
                 self.detail_info.configure(text="")
                 self.detail_timestamp.configure(text="")
-                for widget in self.paths_frame.winfo_children():
-                    widget.destroy()
+                self._clear_paths_frame()
                 
-                # Reload sessions list
+                # Reload sessions list to drop the deleted session
                 self.load_sessions()
             else:
-                # Session still has paths - reload the display
+                # Session still has paths - drop the removed rows and recount
+                # from the remaining ones instead of re-reading from disk
+                remaining = []
+                for path_item in self.path_items:
+                    if path_item.path == path_to_delete:
+                        path_item.destroy()
+                    else:
+                        remaining.append(path_item)
+                self.path_items = remaining
+                
+                window_count = len(set(item.path for item in remaining))
+                tab_count = len(remaining)
+                
                 if self.selected_session:
-                    # Reload session data to get updated counts
-                    session_data = self.session_manager.load_session(session_filepath)
-                    windows = session_data.get("windows", [])
-                    
-                    updated_session_data = self.selected_session.copy()
-                    updated_session_data["window_count"] = len(set(w["path"] for w in windows))
-                    updated_session_data["tab_count"] = len(windows)
-                    self.select_session(updated_session_data)
+                    self.selected_session = self.selected_session.copy()
+                    self.selected_session["window_count"] = window_count
+                    self.selected_session["tab_count"] = tab_count
+                    self.detail_info.configure(text=_format_counts(window_count, tab_count))
                 
-                # Reload sessions list to update counts
-                self.load_sessions()
+                self._update_card_counts(session_filepath, window_count, tab_count)
                 
         except Exception as e:
             messagebox.showerror(
@@ -718,6 +892,17 @@ class SnapBackApp(ctk.CTk):
                 f"Failed to remove folder from session:\n{str(e)}"
             )
     
+    def _update_card_counts(self, filepath, window_count, tab_count):
+        """Patch the window/tab counts shown on a single session card."""
+        card = self.cards_by_filepath.get(filepath)
+        if card is None:
+            return
+        
+        session_data = card.session_data.copy()
+        session_data["window_count"] = window_count
+        session_data["tab_count"] = tab_count
+        card.update_session(session_data)
+    
     def add_folder_to_session(self):
         """Add a new folder to the currently selected session."""
         if not self.selected_session:
@@ -741,6 +926,8 @@ class SnapBackApp(ctk.CTk):
             
             # Use SessionManager to add the path
             was_added = self.session_manager.add_path_to_session(session_filepath, folder_path)
+            # Write the queued edit now so a failure is reported below
+            self.session_manager.flush()
             
             if not was_added:
                 messagebox.showinfo(
@@ -758,7 +945,7 @@ class SnapBackApp(ctk.CTk):
                 updated_session_data = self.selected_session.copy()
                 updated_session_data["window_count"] = len(set(w["path"] for w in windows))
                 updated_session_data["tab_count"] = len(windows)
-                self.select_session(updated_session_data)
+                self.select_session(updated_session_data, force=True)
             
             # Reload sessions list to update counts
             self.load_sessions()
@@ -4,23 +4,142 @@ Backend module for managing Explorer sessions.
 Handles saving, restoring, and managing session files.
 """
 import os
+import re
 import json
+import ctypes
+from ctypes import wintypes
 import time
+import threading
 import subprocess
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Deque, List, Dict, Optional
 
 try:
+    import pythoncom
     import win32com.client
     import win32gui
     import win32con
+    from win32com.shell import shell as win32shell, shellcon
 except Exception as e:
     raise SystemExit("pywin32 is required. Install with: pip install pywin32\nError: " + str(e))
 
+# WinEvent hook constants (winuser.h) used to wait for new Explorer windows
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+QS_ALLINPUT = 0x04FF
+PM_NOREMOVE = 0x0000
+EXPLORER_WINDOW_CLASSES = ("CabinetWClass", "ExploreWClass")
+
+# Characters dropped from session names when building filenames
+_SAFE_NAME_RE = re.compile(r"[^\w \-]", re.UNICODE)
+
+WinEventProc = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+
+# Private user32 handle so the prototypes below don't affect ctypes.windll users
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_user32.SetWinEventHook.restype = wintypes.HANDLE
+_user32.SetWinEventHook.argtypes = (
+    wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+)
+_user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+_user32.MsgWaitForMultipleObjects.argtypes = (
+    wintypes.DWORD, ctypes.c_void_p, wintypes.BOOL, wintypes.DWORD, wintypes.DWORD
+)
+_user32.PeekMessageW.argtypes = (
+    ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT, wintypes.UINT
+)
+
+# orjson is optional; it is much faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# fastjsonschema is optional; when present, session files are validated
+# right after parsing so malformed ones fail fast with a clear message
+SESSION_SCHEMA = {
+    "type": "object",
+    "required": ["windows", "name", "saved_at"],
+    "properties": {
+        "windows": {
+            "type": "array",
+            "items": {"type": "object", "required": ["path", "rect", "show_cmd"]}
+        }
+    }
+}
+
+try:
+    import fastjsonschema
+    _validate_session = fastjsonschema.compile(SESSION_SCHEMA)
+except ImportError:
+    _validate_session = None
+
+
+def _dump_json(payload) -> bytes:
+    """Serialize a session payload to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _load_json(data: bytes):
+    """Parse UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _count_windows(windows: List[Dict]):
+    """Return (window_count, tab_count) for a session's window entries."""
+    # Count tabs and distinct paths in a single pass
+    if len(windows) <= 1:
+        return len(windows), len(windows)
+    
+    seen = set()
+    tab_count = 0
+    for w in windows:
+        tab_count += 1
+        seen.add(w["path"])
+    return len(seen), tab_count
+
 
 class SessionManager:
     """Manages Explorer window sessions."""
     
+    # Maximum number of parsed sessions kept in memory
+    _PARSE_CACHE_MAX = 128
+    
+    # Delay before queued session edits are written, so bursts of edits
+    # collapse into a single write per file
+    _FLUSH_DELAY = 0.05
+    
+    # Delay before queued edits that failed to write are tried again
+    _FLUSH_RETRY_DELAY = 1.0
+    
+    # Pixel difference below which a window is considered already in place
+    _GEOMETRY_TOLERANCE = 2
+    
+    # Upper bound on threads used to launch Explorer windows concurrently
+    _MAX_RESTORE_WORKERS = 16
+    
+    # Summary index of all sessions, so listing doesn't parse every file.
+    # The leading dot can't come out of save_session's name sanitizing.
+    INDEX_FILENAME = ".index.json"
+    
+    # Keys every index entry must have; entries missing any are rebuilt
+    _INDEX_KEYS = ("name", "saved_at", "window_count", "tab_count", "mtime_ns", "size")
+    
     def __init__(self, sessions_dir: str = None):
         """Initialize the session manager.
         
@@ -31,62 +150,113 @@ class SessionManager:
             sessions_dir = os.path.join(os.path.dirname(__file__), "sessions")
         self.sessions_dir = sessions_dir
         self._ensure_sessions_dir()
+        
+        # sessions_dir with exactly one trailing separator (same result as
+        # os.path.join), so file paths are built with a single concatenation
+        self._sessions_dir_prefix = os.path.join(sessions_dir, "")
+        self._index_path = self._sessions_dir_prefix + self.INDEX_FILENAME
+        
+        # Per-thread Shell.Application objects (COM objects are apartment-bound)
+        self._local = threading.local()
+        
+        # LRU of parsed sessions: filepath -> (mtime_ns, size, data, raw bytes)
+        self._parse_cache = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        
+        # Sessions index: filename -> summary, loaded lazily by _get_index()
+        self._index = None
+        
+        # Edited sessions waiting to be written by flush(): filepath -> data.
+        # flush() runs on a timer thread, so the same lock also guards the
+        # sessions index and every session/index file write
+        self._pending_writes = {}
+        self._pending_lock = threading.RLock()
+        self._flush_timer = None
     
     def _ensure_sessions_dir(self):
         """Create sessions directory if it doesn't exist."""
         if not os.path.exists(self.sessions_dir):
             os.makedirs(self.sessions_dir)
     
+    def _get_shell(self):
+        """Return the Shell.Application object for the current thread.
+        
+        The object is dispatched once per thread and reused afterwards.
+        """
+        shell = getattr(self._local, "shell", None)
+        if shell is None:
+            if threading.current_thread() is not threading.main_thread():
+                pythoncom.CoInitialize()
+            shell = win32com.client.Dispatch("Shell.Application")
+            self._local.shell = shell
+        return shell
+    
     def get_all_explorer_windows(self) -> List[Dict]:
         """Get all open Explorer windows with their geometry.
         
         Returns:
             List of dicts with keys: path, hwnd, rect, show_cmd
         """
-        shell = win32com.client.Dispatch("Shell.Application")
+        shell = self._get_shell()
         windows = []
         
         for w in shell.Windows():
+            info = self._shell_window_info(w)
+            if info is None:
+                continue
+            path, hwnd = info
+            
+            # Get window placement
             try:
-                doc = w.Document
-                folder = getattr(doc, "Folder", None)
-                if folder is None:
-                    continue
-                
-                path = folder.Self.Path
-                hwnd = int(w.HWND)
-                
-                # Get window placement
+                placement = win32gui.GetWindowPlacement(hwnd)
+                show_cmd = placement[1]
+                normal_rect = placement[4]  # (left, top, right, bottom)
+                left, top, right, bottom = normal_rect
+                width = right - left
+                height = bottom - top
+                rect = [left, top, width, height]
+            except Exception:
+                # Fallback to GetWindowRect
                 try:
-                    placement = win32gui.GetWindowPlacement(hwnd)
-                    show_cmd = placement[1]
-                    normal_rect = placement[4]  # (left, top, right, bottom)
-                    left, top, right, bottom = normal_rect
+                    left, top, right, bottom = win32gui.GetWindowRect(hwnd)
                     width = right - left
                     height = bottom - top
                     rect = [left, top, width, height]
+                    show_cmd = win32con.SW_SHOWNORMAL
                 except Exception:
-                    # Fallback to GetWindowRect
-                    try:
-                        left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-                        width = right - left
-                        height = bottom - top
-                        rect = [left, top, width, height]
-                        show_cmd = win32con.SW_SHOWNORMAL
-                    except Exception:
-                        continue
-                
-                windows.append({
-                    "path": path,
-                    "hwnd": hwnd,
-                    "rect": rect,
-                    "show_cmd": show_cmd
-                })
-            except Exception:
-                continue
+                    continue
+            
+            windows.append({
+                "path": path,
+                "hwnd": hwnd,
+                "rect": rect,
+                "show_cmd": show_cmd
+            })
         
         return windows
     
+    def _shell_window_info(self, w) -> Optional[tuple]:
+        """Return (path, hwnd) for a Shell.Application window, or None.
+        
+        Windows without a file-system folder are skipped with getattr guards
+        rather than by raising; the except only covers COM calls failing on
+        a window that closes mid-enumeration.
+        """
+        try:
+            doc = getattr(w, "Document", None)
+            folder = getattr(doc, "Folder", None) if doc is not None else None
+            if folder is None:
+                return None
+            
+            self_obj = getattr(folder, "Self", None)
+            path = getattr(self_obj, "Path", None) if self_obj is not None else None
+            if not path:
+                return None
+            
+            return path, int(w.HWND)
+        except Exception:
+            return None
+    
     def save_session(self, name: str = None) -> str:
         """Save current Explorer session.
         
@@ -98,19 +268,14 @@ class SessionManager:
         """
         windows = self.get_all_explorer_windows()
         
-        # Deduplicate by path (keep first seen)
-        seen = set()
-        session_entries = []
+        # Deduplicate by path (keep first seen; dicts preserve insertion order)
+        by_path = {}
         for w in windows:
-            p = w["path"]
-            if p in seen:
-                continue
-            seen.add(p)
-            session_entries.append({
-                "path": p,
-                "rect": w["rect"],
-                "show_cmd": w["show_cmd"]
-            })
+            by_path.setdefault(w["path"], w)
+        session_entries = [
+            {"path": p, "rect": w["rect"], "show_cmd": w["show_cmd"]}
+            for p, w in by_path.items()
+        ]
         
         timestamp = datetime.now()
         payload = {
@@ -122,34 +287,173 @@ class SessionManager:
         # Generate filename
         if name:
             # Use custom name, sanitize it
-            safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+            safe_name = _SAFE_NAME_RE.sub("", name).strip()
             filename = f"{safe_name}.json"
         else:
             # Use timestamp
             filename = f"session_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
         
-        filepath = os.path.join(self.sessions_dir, filename)
-        
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        filepath = self._sessions_dir_prefix + filename
+        with self._pending_lock:
+            self._pending_writes.pop(filepath, None)
+            self._invalidate_cached(filepath)
+            self._write_session(filepath, payload)
         
         return filepath
     
-    def load_session(self, filepath: str) -> Dict:
+    def load_session(self, filepath: str, stat_result: os.stat_result = None) -> Dict:
         """Load a session from file.
         
         Args:
             filepath: Path to the session file.
+            stat_result: Optional stat of the file (e.g. from os.scandir) to
+                avoid another stat call.
         
         Returns:
-            Dictionary with session data.
+            Dictionary with session data, validated against SESSION_SCHEMA
+            when fastjsonschema is installed. Repeated loads of an unchanged file
+            (same mtime and size) return the cached object, so callers that
+            modify it must call _invalidate_cached() first. Edits that are
+            queued but not yet flushed are included.
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with self._pending_lock:
+            pending = self._pending_writes.get(filepath)
+        if pending is not None:
+            return pending
+        
+        st = stat_result if stat_result is not None else os.stat(filepath)
+        cached = self._get_cached(filepath, st)
+        if cached is not None:
+            return cached[2]
+        
+        with open(filepath, "rb") as f:
+            raw = f.read()
+        data = _load_json(raw)
+        if _validate_session is not None:
+            _validate_session(data)
+        self._cache_session(filepath, st, data, raw)
+        
+        return data
+    
+    def load_session_bytes(self, filepath: str) -> bytes:
+        """Load a session's serialized JSON without parsing it.
+        
+        Args:
+            filepath: Path to the session file.
+        
+        Returns:
+            The session file contents (including unflushed edits).
+        """
+        with self._pending_lock:
+            pending = self._pending_writes.get(filepath)
+        if pending is not None:
+            return _dump_json(pending)
+        
+        cached = self._get_cached(filepath, os.stat(filepath))
+        if cached is not None:
+            return cached[3]
+        
+        with open(filepath, "rb") as f:
+            return f.read()
+    
+    def _get_cached(self, filepath: str, st: os.stat_result) -> Optional[tuple]:
+        """Return the parse cache entry for filepath if it matches st."""
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(filepath)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._parse_cache.move_to_end(filepath)
+                return cached
+        return None
+    
+    def _cache_session(self, filepath: str, st: os.stat_result, data: Dict, raw: bytes):
+        """Store a session's parsed data and raw bytes in the parse cache."""
+        with self._parse_cache_lock:
+            self._parse_cache[filepath] = (st.st_mtime_ns, st.st_size, data, raw)
+            self._parse_cache.move_to_end(filepath)
+            while len(self._parse_cache) > self._PARSE_CACHE_MAX:
+                self._parse_cache.popitem(last=False)
+    
+    def _write_session(self, filepath: str, data: Dict):
+        """Atomically write a session file and cache what was written."""
+        with self._pending_lock:
+            raw = self._atomic_write_json(filepath, data)
+            st = os.stat(filepath)
+            self._cache_session(filepath, st, data, raw)
+            self._update_index(filepath, data, st)
+    
+    def _load_for_edit(self, filepath: str) -> Dict:
+        """Return a session's data for in-place modification.
+        
+        Uses the queued copy if the session already has unflushed edits,
+        otherwise loads it and detaches it from the parse cache. Callers
+        must hold _pending_lock.
+        """
+        data = self._pending_writes.get(filepath)
+        if data is None:
+            data = self.load_session(filepath)
+            self._invalidate_cached(filepath)
+        return data
+    
+    def _schedule_write(self, filepath: str, data: Dict):
+        """Queue a modified session to be written after _FLUSH_DELAY."""
+        with self._pending_lock:
+            self._pending_writes[filepath] = data
+            self._start_flush_timer(self._FLUSH_DELAY)
+    
+    def _start_flush_timer(self, delay: float):
+        """(Re)arm the timer that writes queued edits. Caller holds _pending_lock."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_timer = threading.Timer(delay, self._flush_in_background)
+        self._flush_timer.start()
+    
+    def _flush_in_background(self):
+        """Timer callback; failed edits stay queued and are retried."""
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"Error saving queued session edits: {e}")
+    
+    def flush(self):
+        """Write all queued session edits to disk now.
+        
+        Edits that fail to write stay queued and are retried after
+        _FLUSH_RETRY_DELAY, so they are not lost.
+        
+        Raises:
+            The first write error, after every queued session was attempted.
+        """
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            pending, self._pending_writes = self._pending_writes, {}
+            error = None
+            for filepath, data in pending.items():
+                try:
+                    self._write_session(filepath, data)
+                except Exception as e:
+                    print(f"Error saving session {filepath}: {e}")
+                    self._pending_writes[filepath] = data
+                    if error is None:
+                        error = e
+            
+            if error is not None:
+                self._start_flush_timer(self._FLUSH_RETRY_DELAY)
+                raise error
+    
+    def _invalidate_cached(self, filepath: str):
+        """Drop a session from the parse cache."""
+        with self._parse_cache_lock:
+            self._parse_cache.pop(filepath, None)
     
     def list_sessions(self) -> List[Dict]:
         """List all saved sessions.
         
+        Summaries come from the sessions index; only files that are new or
+        changed since they were indexed are parsed.
+        
         Returns:
             List of dicts with keys: filepath, name, saved_at, window_count, tab_count
         """
@@ -158,39 +462,147 @@ class SessionManager:
         if not os.path.exists(self.sessions_dir):
             return sessions
         
-        for filename in os.listdir(self.sessions_dir):
-            if not filename.endswith(".json"):
-                continue
+        # Make sure queued edits are on disk before reading the directory.
+        # Edits that can't be written stay queued (and load_session still
+        # returns them), so listing carries on with what is on disk.
+        try:
+            self.flush()
+        except Exception:
+            pass
+        
+        with self._pending_lock:
+            index = self._get_index()
+            listed = set()
+            index_changed = False
             
-            filepath = os.path.join(self.sessions_dir, filename)
-            try:
-                data = self.load_session(filepath)
-                windows = data.get("windows", [])
-                
-                sessions.append({
-                    "filepath": filepath,
-                    "name": data.get("name", filename),
-                    "saved_at": data.get("saved_at", ""),
-                    "window_count": len(set(w["path"] for w in windows)),
-                    "tab_count": len(windows)
-                })
-            except Exception as e:
-                print(f"Error loading session {filename}: {e}")
-                continue
+            with os.scandir(self.sessions_dir) as it:
+                for entry in it:
+                    if (not entry.name.endswith(".json") or entry.name == self.INDEX_FILENAME
+                            or not entry.is_file()):
+                        continue
+                    
+                    try:
+                        st = entry.stat()
+                        summary = index.get(entry.name)
+                        
+                        # Only parse files that are new or changed since indexed
+                        if (summary is None or summary["mtime_ns"] != st.st_mtime_ns
+                                or summary["size"] != st.st_size):
+                            data = self.load_session(entry.path, st)
+                            summary = self._summarize(data, entry.name, st)
+                            index[entry.name] = summary
+                            index_changed = True
+                        
+                        listed.add(entry.name)
+                        sessions.append({
+                            "filepath": entry.path,
+                            "name": summary["name"],
+                            "saved_at": summary["saved_at"],
+                            "window_count": summary["window_count"],
+                            "tab_count": summary["tab_count"]
+                        })
+                    except Exception as e:
+                        print(f"Error loading session {entry.name}: {e}")
+                        continue
+            
+            # Forget sessions whose files are gone
+            for filename in [name for name in index if name not in listed]:
+                del index[filename]
+                index_changed = True
+            
+            if index_changed:
+                self._save_index()
         
         # Sort by saved_at descending (newest first)
         sessions.sort(key=lambda x: x["saved_at"], reverse=True)
         
         return sessions
     
+    def _atomic_write_json(self, path: str, payload) -> bytes:
+        """Write payload as JSON to path without ever leaving a partial file.
+        
+        The data is written and flushed to a temporary file next to path,
+        which then atomically replaces it.
+        
+        Returns:
+            The bytes that were written.
+        """
+        raw = _dump_json(payload)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return raw
+    
+    def _summarize(self, data: Dict, filename: str, st: os.stat_result) -> Dict:
+        """Build the index entry for a parsed session file."""
+        window_count, tab_count = _count_windows(data.get("windows", []))
+        return {
+            "name": data.get("name", filename),
+            "saved_at": data.get("saved_at", ""),
+            "window_count": window_count,
+            "tab_count": tab_count,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size
+        }
+    
+    def _get_index(self) -> Dict[str, Dict]:
+        """Return the sessions index, reading it from disk on first use.
+        
+        Callers must hold _pending_lock while using the returned dict.
+        """
+        with self._pending_lock:
+            if self._index is None:
+                try:
+                    with open(self._index_path, "rb") as f:
+                        index = _load_json(f.read())
+                except Exception:
+                    # Missing or unreadable index; list_sessions rebuilds it
+                    index = None
+                if not isinstance(index, dict):
+                    index = {}
+                
+                # Drop malformed entries so their files are parsed again
+                self._index = {
+                    filename: summary for filename, summary in index.items()
+                    if isinstance(summary, dict)
+                    and all(key in summary for key in self._INDEX_KEYS)
+                }
+            return self._index
+    
+    def _save_index(self):
+        """Write the sessions index to disk."""
+        with self._pending_lock:
+            self._atomic_write_json(self._index_path, self._get_index())
+    
+    def _update_index(self, filepath: str, data: Dict = None, st: os.stat_result = None):
+        """Refresh (or with data=None, remove) a session's index entry."""
+        filename = os.path.basename(filepath)
+        with self._pending_lock:
+            index = self._get_index()
+            if data is None:
+                if index.pop(filename, None) is None:
+                    return
+            else:
+                if st is None:
+                    st = os.stat(filepath)
+                index[filename] = self._summarize(data, filename, st)
+            self._save_index()
+    
     def delete_session(self, filepath: str):
         """Delete a session file.
         
         Args:
             filepath: Path to the session file to delete.
         """
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        with self._pending_lock:
+            self._pending_writes.pop(filepath, None)
+            self._invalidate_cached(filepath)
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            self._update_index(filepath)
     
     def restore_session(self, filepath: str, open_timeout: float = 2.0, poll_interval: float = 0.1):
         """Restore a saved session.
@@ -214,6 +626,11 @@ class SessionManager:
         to_open = []
         to_restore = []
         
+        # Enumerate the open Explorer windows once for the initial matching;
+        # path_cache lets later scans skip COM when no window has appeared
+        path_cache = {}
+        snapshot = self._snapshot_explorer_windows(path_cache=path_cache)
+        
         for w in windows:
             path = w.get("path")
             rect = w.get("rect")
@@ -224,7 +641,7 @@ class SessionManager:
                 continue
             
             # Try to find an already-open window for this path
-            hwnd = self._find_window_by_path(path, used_hwnds)
+            hwnd = self._claim_window(snapshot, path, used_hwnds)
             
             if hwnd is not None:
                 # Already open, just needs geometry applied
@@ -234,33 +651,31 @@ class SessionManager:
                 # Need to open this window
                 to_open.append((path, rect, show_cmd))
         
-        # Launch ALL new windows in parallel (don't wait)
-        for path, rect, show_cmd in to_open:
-            try:
-                subprocess.Popen(["explorer", path], shell=False)
-            except Exception as e:
-                print(f"Failed to start explorer for {path!r}: {e}")
-                skipped += 1
+        # Launch ALL new windows in parallel (don't wait); process creation
+        # latency overlaps across the worker threads
+        launched = []
+        if to_open:
+            with ThreadPoolExecutor(max_workers=min(self._MAX_RESTORE_WORKERS, len(to_open))) as pool:
+                results = list(pool.map(lambda item: self._launch_explorer(item[0]), to_open))
+            for item, ok in zip(to_open, results):
+                if ok:
+                    launched.append(item)
+                else:
+                    skipped += 1
         
         # Now wait for all windows to appear and match them
-        if to_open:
+        if launched:
+            remaining = list(launched)  # Copy the list
             deadline = time.time() + open_timeout
-            remaining = list(to_open)  # Copy the list
             
-            while remaining and time.time() < deadline:
-                # Check all remaining windows at once
-                for i in range(len(remaining) - 1, -1, -1):
-                    path, rect, show_cmd = remaining[i]
-                    hwnd = self._find_window_by_path(path, used_hwnds)
-                    
-                    if hwnd is not None:
-                        # Found it!
-                        to_restore.append((hwnd, rect, show_cmd))
-                        used_hwnds.add(hwnd)
-                        remaining.pop(i)
-                
-                if remaining:
-                    time.sleep(poll_interval)
+            try:
+                self._wait_for_windows_hooked(remaining, to_restore, used_hwnds, path_cache,
+                                              deadline)
+            except OSError as e:
+                # Hook could not be installed; fall back to polling
+                print(f"Window event hook unavailable, polling instead: {e}")
+                self._wait_for_windows_polling(remaining, to_restore, used_hwnds, deadline,
+                                               poll_interval)
             
             # Count any that didn't open in time as skipped
             for path, _, _ in remaining:
@@ -268,48 +683,260 @@ class SessionManager:
                 skipped += 1
         
         # Apply geometry to all windows (both already-open and newly-opened)
-        for hwnd, rect, show_cmd in to_restore:
-            success = self._apply_geometry(hwnd, rect, show_cmd)
-            if success:
-                restored += 1
-            else:
-                skipped += 1
+        if to_restore:
+            moved, failed = self._apply_geometry_batch(to_restore)
+            restored += moved
+            skipped += failed
         
         return restored, skipped
     
-    def _find_window_by_path(self, path: str, used_hwnds: set = None) -> Optional[int]:
-        """Find an existing shell window with matching path which is not used yet.
+    def _match_new_windows(self, remaining: List[tuple], to_restore: List[tuple],
+                           used_hwnds: set, path_cache: Dict[int, List[str]] = None):
+        """Match launched windows that have appeared, moving them to to_restore.
         
         Args:
-            path: Path to search for.
-            used_hwnds: Set of already-used window handles.
+            remaining: (path, rect, show_cmd) entries still waited for; matched
+                entries are removed in place.
+            to_restore: List receiving (hwnd, rect, show_cmd) for matches.
+            used_hwnds: Set of already-used window handles; updated in place.
+            path_cache: Optional hwnd -> paths cache, see _explorer_window_paths().
+        """
+        # Check all remaining windows at once against a single enumeration
+        snapshot = self._snapshot_explorer_windows(exclude=used_hwnds, path_cache=path_cache)
+        for i in range(len(remaining) - 1, -1, -1):
+            path, rect, show_cmd = remaining[i]
+            hwnd = self._claim_window(snapshot, path, used_hwnds)
+            
+            if hwnd is not None:
+                # Found it!
+                to_restore.append((hwnd, rect, show_cmd))
+                used_hwnds.add(hwnd)
+                remaining.pop(i)
+    
+    def _wait_for_windows_polling(self, remaining: List[tuple], to_restore: List[tuple],
+                                  used_hwnds: set, deadline: float, poll_interval: float):
+        """Wait for launched windows by re-enumerating every poll_interval.
         
-        Returns:
-            Window handle if found, None otherwise.
+        Paths are re-read over COM on every pass, since without window
+        events there is no way to tell when a window has navigated.
         """
-        if used_hwnds is None:
-            used_hwnds = set()
+        while remaining and time.time() < deadline:
+            self._match_new_windows(remaining, to_restore, used_hwnds)
+            if remaining:
+                time.sleep(poll_interval)
+    
+    def _wait_for_windows_hooked(self, remaining: List[tuple], to_restore: List[tuple],
+                                 used_hwnds: set, path_cache: Dict[int, List[str]],
+                                 deadline: float, rescan_interval: float = 0.5):
+        """Wait for launched windows, waking up on Explorer window events.
         
-        shell = win32com.client.Dispatch("Shell.Application")
-        for w in shell.Windows():
+        A WinEvent hook reports Explorer windows being created, shown or
+        retitled (the title changes once the folder has loaded), and the
+        shell windows are only enumerated after such an event. Reported
+        windows are dropped from path_cache so their path is re-read over
+        COM. A slow rescan every rescan_interval covers any event that was
+        missed.
+        
+        Raises:
+            OSError: If the hook could not be installed.
+        """
+        user32 = _user32
+        woken = [False]
+        
+        def on_event(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+            if id_object != OBJID_WINDOW or not hwnd:
+                return
             try:
-                doc = w.Document
-                folder = getattr(doc, "Folder", None)
-                if folder is None:
-                    continue
+                if win32gui.GetClassName(hwnd) in EXPLORER_WINDOW_CLASSES:
+                    path_cache.pop(hwnd, None)
+                    woken[0] = True
+            except Exception:
+                pass
+        
+        # Keep a reference to the callback for as long as the hooks exist
+        callback = WinEventProc(on_event)
+        flags = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        hooks = [
+            user32.SetWinEventHook(EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, 0, callback, 0, 0, flags),
+            user32.SetWinEventHook(EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE, 0, callback,
+                                   0, 0, flags),
+        ]
+        
+        try:
+            if not all(hooks):
+                raise ctypes.WinError(ctypes.get_last_error())
+            
+            # Windows may already have appeared before the hooks were installed
+            self._match_new_windows(remaining, to_restore, used_hwnds, path_cache)
+            last_scan = time.time()
+            msg = wintypes.MSG()
+            
+            while remaining:
+                now = time.time()
+                if now >= deadline:
+                    break
                 
-                window_path = folder.Self.Path
-                hwnd = int(w.HWND)
+                timeout = min(deadline - now, max(0.0, last_scan + rescan_interval - now))
+                user32.MsgWaitForMultipleObjects(0, None, False, int(timeout * 1000), QS_ALLINPUT)
                 
-                if window_path == path and hwnd not in used_hwnds:
-                    return hwnd
+                # Out-of-context hook callbacks are delivered while peeking;
+                # other messages are left queued for the caller's own loop
+                user32.PeekMessageW(ctypes.byref(msg), 0, 0, 0, PM_NOREMOVE)
+                
+                if woken[0] or time.time() - last_scan >= rescan_interval:
+                    woken[0] = False
+                    self._match_new_windows(remaining, to_restore, used_hwnds, path_cache)
+                    last_scan = time.time()
+        finally:
+            for hook in hooks:
+                if hook:
+                    user32.UnhookWinEvent(hook)
+    
+    def _launch_explorer(self, path: str) -> bool:
+        """Open an Explorer window for path without waiting for it.
+        
+        Asks the running shell to open the folder via ShellExecuteEx, which
+        avoids creating an explorer.exe process per window; falls back to
+        launching explorer.exe if that fails.
+        
+        Returns:
+            True if the launch was started, False otherwise.
+        """
+        try:
+            # ShellExecuteEx needs COM on the calling (worker) thread
+            pythoncom.CoInitialize()
+            try:
+                win32shell.ShellExecuteEx(
+                    fMask=shellcon.SEE_MASK_NOASYNC,
+                    lpVerb="open",
+                    lpFile=path,
+                    nShow=win32con.SW_SHOWNORMAL,
+                )
+            finally:
+                pythoncom.CoUninitialize()
+            return True
+        except Exception as e:
+            print(f"ShellExecuteEx failed for {path!r}, using explorer.exe: {e}")
+        
+        try:
+            subprocess.Popen(["explorer", path], shell=False)
+            return True
+        except Exception as e:
+            print(f"Failed to start explorer for {path!r}: {e}")
+            return False
+    
+    def _enum_explorer_hwnds(self) -> set:
+        """Return the handles of all top-level Explorer windows.
+        
+        Uses plain EnumWindows/GetClassName calls, which are far cheaper
+        than walking the Shell.Application windows over COM.
+        """
+        hwnds = set()
+        
+        def collect(hwnd, _):
+            try:
+                if win32gui.GetClassName(hwnd) in EXPLORER_WINDOW_CLASSES:
+                    hwnds.add(hwnd)
             except Exception:
+                pass
+            return True
+        
+        win32gui.EnumWindows(collect, None)
+        return hwnds
+    
+    def _explorer_window_paths(self, path_cache: Dict[int, List[str]] = None) -> Dict[int, List[str]]:
+        """Map each open Explorer window handle to its folder paths.
+        
+        Tabs of one Explorer window share its handle, so a window can have
+        several paths.
+        
+        Args:
+            path_cache: Optional hwnd -> paths dict reused across calls. When
+                every open Explorer window is already in it, no COM calls are
+                made; otherwise Shell.Application is walked and it is refreshed.
+        
+        Returns:
+            Dict of hwnd -> list of paths, in shell enumeration order.
+        """
+        if path_cache is not None and path_cache:
+            open_hwnds = self._enum_explorer_hwnds()
+            if open_hwnds.issubset(path_cache):
+                return {hwnd: paths for hwnd, paths in path_cache.items() if hwnd in open_hwnds}
+        
+        paths = {}
+        
+        for w in self._get_shell().Windows():
+            info = self._shell_window_info(w)
+            if info is not None:
+                path, hwnd = info
+                hwnd_paths = paths.get(hwnd)
+                if hwnd_paths is None:
+                    paths[hwnd] = hwnd_paths = []
+                hwnd_paths.append(path)
+        
+        if path_cache is not None:
+            path_cache.clear()
+            path_cache.update(paths)
+        
+        return paths
+    
+    def _snapshot_explorer_windows(self, exclude: set = None,
+                                   path_cache: Dict[int, List[str]] = None) -> Dict[str, Deque[int]]:
+        """Map the path of every open Explorer window to its window handles.
+        
+        Args:
+            exclude: Set of window handles to leave out.
+            path_cache: Optional hwnd -> paths cache, see _explorer_window_paths().
+        
+        Returns:
+            Dict of path -> deque of window handles, in shell enumeration order.
+            A tabbed window is listed under each of its tabs' paths, so claim
+            windows with _claim_window(), which skips ones already used.
+        """
+        snapshot = {}
+        
+        for hwnd, paths in self._explorer_window_paths(path_cache).items():
+            if exclude and hwnd in exclude:
                 continue
+            for path in paths:
+                hwnds = snapshot.get(path)
+                if hwnds is None:
+                    snapshot[path] = hwnds = deque()
+                elif hwnds[-1] == hwnd:
+                    # Two tabs of this window show the same folder
+                    continue
+                hwnds.append(hwnd)
         
+        return snapshot
+    
+    def _claim_window(self, snapshot: Dict[str, Deque[int]], path: str,
+                      used_hwnds: set) -> Optional[int]:
+        """Pop the first window for path from a snapshot that isn't used yet."""
+        hwnds = snapshot.get(path)
+        while hwnds:
+            hwnd = hwnds.popleft()
+            if hwnd not in used_hwnds:
+                return hwnd
         return None
     
-    def _apply_geometry(self, hwnd: int, rect: List[int], show_cmd: int) -> bool:
-        """Apply geometry and show state to window.
+    def _find_window_by_path(self, path: str, used_hwnds: set = None) -> Optional[int]:
+        """Find an existing shell window with matching path which is not used yet.
+        
+        restore_session matches against a single snapshot instead; this is
+        kept for one-off lookups.
+        
+        Args:
+            path: Path to search for.
+            used_hwnds: Set of already-used window handles.
+        
+        Returns:
+            Window handle if found, None otherwise.
+        """
+        snapshot = self._snapshot_explorer_windows(exclude=used_hwnds)
+        return self._claim_window(snapshot, path, used_hwnds or set())
+    
+    def _plan_geometry(self, hwnd: int, rect: List[int], show_cmd: int) -> Optional[tuple]:
+        """Work out what it takes to bring a window to its saved geometry.
         
         Args:
             hwnd: Window handle.
@@ -317,28 +944,141 @@ class SessionManager:
             show_cmd: Windows show command constant.
         
         Returns:
-            True if successful, False otherwise.
+            None if the window is already in the saved state and its restored
+            rect is within a couple of pixels of the saved one, otherwise a
+            tuple of (restore_first, rect, final_cmd): whether the window
+            must leave its min/max state before moving, and the ShowWindow
+            command to apply after the move (None if it stays restored).
         """
         left, top, width, height = rect
         
+        # Normalize the saved command to a placement state and the ShowWindow
+        # command that reaches it
+        if show_cmd == win32con.SW_SHOWMAXIMIZED:
+            target_state, target_cmd = win32con.SW_SHOWMAXIMIZED, win32con.SW_MAXIMIZE
+        elif show_cmd == win32con.SW_SHOWMINIMIZED or show_cmd == win32con.SW_MINIMIZE:
+            target_state, target_cmd = win32con.SW_SHOWMINIMIZED, win32con.SW_MINIMIZE
+        else:
+            target_state, target_cmd = win32con.SW_SHOWNORMAL, None
+        
+        placement = win32gui.GetWindowPlacement(hwnd)
+        current_state = placement[1]
+        if current_state not in (win32con.SW_SHOWMAXIMIZED, win32con.SW_SHOWMINIMIZED):
+            current_state = win32con.SW_SHOWNORMAL
+        
+        # placement[4] is the restored rect even while maximized/minimized,
+        # so it also tells which monitor a min/max window belongs to
+        if current_state == target_state:
+            cur_left, cur_top, cur_right, cur_bottom = placement[4]
+            if (abs(cur_left - left) < self._GEOMETRY_TOLERANCE
+                    and abs(cur_top - top) < self._GEOMETRY_TOLERANCE
+                    and abs(cur_right - cur_left - width) < self._GEOMETRY_TOLERANCE
+                    and abs(cur_bottom - cur_top - height) < self._GEOMETRY_TOLERANCE):
+                return None
+        
+        # Geometry applies to the restored window, so leave min/max first
+        return current_state != win32con.SW_SHOWNORMAL, rect, target_cmd
+    
+    def _apply_geometry(self, hwnd: int, rect: List[int], show_cmd: int) -> bool:
+        """Apply geometry and show state to a single window.
+        
+        Args:
+            hwnd: Window handle.
+            rect: [left, top, width, height]
+            show_cmd: Windows show command constant.
+        
+        Returns:
+            True if successful, False otherwise.
+        """
         try:
-            if show_cmd == win32con.SW_SHOWMAXIMIZED:
-                win32gui.MoveWindow(hwnd, left, top, width, height, True)
-                win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
-            elif show_cmd == win32con.SW_SHOWMINIMIZED or show_cmd == win32con.SW_MINIMIZE:
-                win32gui.MoveWindow(hwnd, left, top, width, height, True)
-                win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
-            else:
-                win32gui.MoveWindow(hwnd, left, top, width, height, True)
+            plan = self._plan_geometry(hwnd, rect, show_cmd)
+            if plan is None:
+                return True
+            restore_first, (left, top, width, height), final_cmd = plan
+            
+            if restore_first:
                 win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+            
+            flags = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+            if final_cmd is None:
+                # Nothing follows, so the move can be posted without waiting
+                flags |= win32con.SWP_ASYNCWINDOWPOS
+            win32gui.SetWindowPos(hwnd, 0, left, top, width, height, flags)
+            
+            if final_cmd is not None:
+                win32gui.ShowWindow(hwnd, final_cmd)
             return True
         except Exception as e:
             print(f"Failed to move/show hwnd {hwnd}: {e}")
             return False
     
+    def _apply_geometry_batch(self, items: List[tuple]) -> tuple:
+        """Apply geometry to several windows in one DeferWindowPos batch.
+        
+        All moves are committed together by EndDeferWindowPos, so the desktop
+        repaints once instead of once per window. Min/max states are applied
+        afterwards, since ShowWindow can't be deferred. If the batch fails,
+        windows are moved one by one instead.
+        
+        Args:
+            items: List of (hwnd, rect, show_cmd) tuples.
+        
+        Returns:
+            Tuple of (windows restored, windows that failed).
+        """
+        restored = 0
+        skipped = 0
+        plans = []
+        for hwnd, rect, show_cmd in items:
+            try:
+                plan = self._plan_geometry(hwnd, rect, show_cmd)
+            except Exception as e:
+                print(f"Failed to read placement of hwnd {hwnd}: {e}")
+                skipped += 1
+                continue
+            if plan is None:
+                restored += 1
+            else:
+                plans.append((hwnd, plan))
+        
+        if not plans:
+            return restored, skipped
+        
+        try:
+            for hwnd, (restore_first, _, _) in plans:
+                if restore_first:
+                    win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+            
+            flags = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+            hdwp = win32gui.BeginDeferWindowPos(len(plans))
+            for hwnd, (_, (left, top, width, height), _) in plans:
+                hdwp = win32gui.DeferWindowPos(hdwp, hwnd, 0, left, top, width, height, flags)
+            win32gui.EndDeferWindowPos(hdwp)
+        except Exception as e:
+            print(f"Batched window move failed, moving windows one by one: {e}")
+            for hwnd, (_, rect, final_cmd) in plans:
+                show_cmd = win32con.SW_SHOWNORMAL if final_cmd is None else final_cmd
+                if self._apply_geometry(hwnd, rect, show_cmd):
+                    restored += 1
+                else:
+                    skipped += 1
+            return restored, skipped
+        
+        for hwnd, (_, _, final_cmd) in plans:
+            try:
+                if final_cmd is not None:
+                    win32gui.ShowWindow(hwnd, final_cmd)
+                restored += 1
+            except Exception as e:
+                print(f"Failed to show hwnd {hwnd}: {e}")
+                skipped += 1
+        return restored, skipped
+    
     def remove_path_from_session(self, filepath: str, path_to_remove: str) -> bool:
         """Remove a specific path from a session.
         
+        The change is queued and written shortly afterwards (see flush()).
+        
         Args:
             filepath: Path to the session file.
             path_to_remove: The folder path to remove from the session.
@@ -346,24 +1086,21 @@ class SessionManager:
         Returns:
             True if session still has paths, False if session is now empty.
         """
-        # Load session data
-        session_data = self.load_session(filepath)
-        windows = session_data.get("windows", [])
-        
-        # Filter out the path to remove
-        updated_windows = [w for w in windows if w.get("path") != path_to_remove]
-        
-        # If all paths removed, delete the entire session file
-        if not updated_windows:
-            self.delete_session(filepath)
-            return False
-        
-        # Update session with remaining windows
-        session_data["windows"] = updated_windows
-        
-        # Save updated session
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(session_data, f, indent=2, ensure_ascii=False)
+        with self._pending_lock:
+            session_data = self._load_for_edit(filepath)
+            windows = session_data.get("windows", [])
+            
+            # Filter out the path to remove
+            updated_windows = [w for w in windows if w.get("path") != path_to_remove]
+            
+            # If all paths removed, delete the entire session file
+            if not updated_windows:
+                self.delete_session(filepath)
+                return False
+            
+            # Update session with remaining windows and queue the save
+            session_data["windows"] = updated_windows
+            self._schedule_write(filepath, session_data)
         
         return True
     
@@ -371,6 +1108,8 @@ class SessionManager:
                            show_cmd: int = None) -> bool:
         """Add a new path to an existing session.
         
+        The change is queued and written shortly afterwards (see flush()).
+        
         Args:
             filepath: Path to the session file.
             new_path: The folder path to add to the session.
@@ -380,36 +1119,33 @@ class SessionManager:
         Returns:
             True if path was added, False if it already exists.
         """
-        # Load session data
-        session_data = self.load_session(filepath)
-        windows = session_data.get("windows", [])
-        
-        # Check if path already exists
-        for window in windows:
-            if window.get("path") == new_path:
-                return False  # Path already exists
-        
-        # Set defaults if not provided
-        if rect is None:
-            # Default window position and size
-            rect = [100, 100, 1000, 600]
-        
-        if show_cmd is None:
-            show_cmd = 1  # SW_SHOWNORMAL
-        
-        # Add new window entry
-        new_window = {
-            "path": new_path,
-            "rect": rect,
-            "show_cmd": show_cmd
-        }
-        windows.append(new_window)
-        
-        # Update session
-        session_data["windows"] = windows
-        
-        # Save updated session
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(session_data, f, indent=2, ensure_ascii=False)
+        with self._pending_lock:
+            session_data = self._load_for_edit(filepath)
+            windows = session_data.get("windows", [])
+            
+            # Check if path already exists
+            for window in windows:
+                if window.get("path") == new_path:
+                    return False  # Path already exists
+            
+            # Set defaults if not provided
+            if rect is None:
+                # Default window position and size
+                rect = [100, 100, 1000, 600]
+            
+            if show_cmd is None:
+                show_cmd = 1  # SW_SHOWNORMAL
+            
+            # Add new window entry
+            new_window = {
+                "path": new_path,
+                "rect": rect,
+                "show_cmd": show_cmd
+            }
+            windows.append(new_window)
+            
+            # Update session and queue the save
+            session_data["windows"] = windows
+            self._schedule_write(filepath, session_data)
         
         return True